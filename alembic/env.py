@@ -0,0 +1,66 @@
+"""
+Alembic environment module.
+This module configures Alembic to migrate the application's models.
+"""
+import os
+from logging.config import fileConfig
+
+from alembic import context
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, pool
+
+from app.api.utils.database import Base
+# Import all models here to ensure they are registered with Base
+from app.api.models import user, post  # noqa
+
+# Load environment variables
+load_dotenv()
+
+# Alembic config object, giving access to the values in alembic.ini
+config = context.config
+
+# Migrations run with the synchronous driver from DATABASE_URL. The URL is
+# used directly rather than stored in the config, whose interpolation would
+# reject percent-encoded passwords
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Configure logging from alembic.ini
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# Metadata used for autogenerate support
+target_metadata = Base.metadata
+
+def run_migrations_offline() -> None:
+    """
+    Run migrations in 'offline' mode.
+    
+    Emits the migration SQL to the script output without connecting to the
+    database.
+    """
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    """
+    Run migrations in 'online' mode against a live database connection.
+    """
+    connectable = create_engine(DATABASE_URL, poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
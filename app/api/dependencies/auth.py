@@ -2,76 +2,85 @@
 Authentication dependencies module.
 This module provides dependencies for authentication.
 """
-from typing import Optional
+import hashlib
+import time
+import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
-from app.api.utils.database import get_db, get_async_db
+from app.api.utils.database import get_async_db
 from app.api.utils.security import SECRET_KEY, ALGORITHM
 from app.api.models.user import User
 from app.api.schemas.token import TokenData
-from app.api.repositories.user import user_repository, async_user_repository
+from app.api.repositories.user import async_user_repository
 
 # OAuth2 password bearer scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
-async def get_current_user_async(
-    token: str = Depends(oauth2_scheme), 
-    db: AsyncSession = Depends(get_async_db)
-) -> User:
+# Error returned whenever the token or its user cannot be validated
+CREDENTIALS_ERROR = {
+    "status_code": status.HTTP_401_UNAUTHORIZED,
+    "detail": "Could not validate credentials",
+    "headers": {"WWW-Authenticate": "Bearer"},
+}
+
+# Token verification arguments, built once
+_DECODE_KWARGS = {
+    "key": SECRET_KEY,
+    "algorithms": [ALGORITHM],
+    "options": {"require": ["sub", "email", "exp"]},
+}
+
+# Verified token cache
+# Structure: {sha256(token): (TokenData, exp)}
+_TOKEN_CACHE_TTL_SECONDS = 30
+_jwt_cache: TTLCache = TTLCache(maxsize=10000, ttl=_TOKEN_CACHE_TTL_SECONDS)
+
+def _decode_cached(token: str) -> TokenData:
     """
-    Async dependency to get the current user from a token.
+    Decode and verify a token, reusing recent verifications of the same token.
+    
+    Only successfully verified tokens are cached, and a cached entry is never
+    served past the token's own expiry.
     
     Args:
         token (str): The token to decode.
-        db (AsyncSession): The async database session.
         
     Returns:
-        User: The current user.
+        TokenData: The token data.
         
     Raises:
-        HTTPException: If authentication fails.
+        jwt.InvalidTokenError: If the token cannot be verified or lacks required claims.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    key = hashlib.sha256(token.encode()).digest()
     
-    try:
-        # Decode the token
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: Optional[int] = payload.get("sub")
-        email: Optional[str] = payload.get("email")
-        
-        if user_id is None or email is None:
-            raise credentials_exception
-            
-        token_data = TokenData(user_id=int(user_id), email=email)
-    except JWTError:
-        raise credentials_exception
-        
-    # Fetch the user from the database
-    user = await async_user_repository.get(db, token_data.user_id)
+    cached = _jwt_cache.get(key)
+    if cached is not None:
+        token_data, exp = cached
+        if exp > time.time():
+            return token_data
     
-    if user is None:
-        raise credentials_exception
-        
-    return user
+    # Decode the token, which must carry the sub, email and exp claims
+    payload = jwt.decode(token, **_DECODE_KWARGS)
+    token_data = TokenData(user_id=int(payload["sub"]), email=payload["email"])
+    
+    # Keep the expiry alongside so the entry is never served past it
+    _jwt_cache[key] = (token_data, payload["exp"])
+    
+    return token_data
 
-def get_current_user(
+async def get_current_user_async(
     token: str = Depends(oauth2_scheme), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
     """
-    Dependency to get the current user from a token.
+    Async dependency to get the current user from a token.
     
     Args:
         token (str): The token to decode.
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
         
     Returns:
         User: The current user.
@@ -79,29 +88,15 @@ def get_current_user(
     Raises:
         HTTPException: If authentication fails.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
     try:
-        # Decode the token
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: Optional[int] = payload.get("sub")
-        email: Optional[str] = payload.get("email")
-        
-        if user_id is None or email is None:
-            raise credentials_exception
-            
-        token_data = TokenData(user_id=int(user_id), email=email)
-    except JWTError:
-        raise credentials_exception
+        token_data = _decode_cached(token)
+    except jwt.InvalidTokenError:
+        raise HTTPException(**CREDENTIALS_ERROR) from None
         
     # Fetch the user from the database
-    user = user_repository.get(db, token_data.user_id)
+    user = await async_user_repository.get_light(db, token_data.user_id)
     
     if user is None:
-        raise credentials_exception
+        raise HTTPException(**CREDENTIALS_ERROR)
         
-    return user 
\ No newline at end of file
+    return user
\ No newline at end of file
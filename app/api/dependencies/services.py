@@ -0,0 +1,24 @@
+"""
+Service dependencies module.
+This module provides dependencies for the application services.
+"""
+from app.api.services.post import PostService, async_post_service
+from app.api.services.user import UserService, async_user_service
+
+async def get_post_service() -> PostService:
+    """
+    Dependency to get the post service bound to the async repository.
+    
+    Returns:
+        PostService: The shared async post service.
+    """
+    return async_post_service
+
+async def get_user_service() -> UserService:
+    """
+    Dependency to get the user service bound to the async repository.
+    
+    Returns:
+        UserService: The shared async user service.
+    """
+    return async_user_service
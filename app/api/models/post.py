@@ -2,7 +2,7 @@
 Post model module.
 This module defines the SQLAlchemy model for the post entity.
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.api.utils.database import Base
@@ -20,6 +20,10 @@ class Post(Base):
         user (User): The relationship to the user who created the post.
     """
     __tablename__ = "posts"
+    __table_args__ = (
+        # Serves lookups of a user's posts, alone or together with the post ID
+        Index("ix_posts_user_id_id", "user_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     text = Column(Text, nullable=False)
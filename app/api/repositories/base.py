@@ -2,10 +2,11 @@
 Base repository module.
 This module provides base repository classes for database operations.
 """
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from functools import lru_cache
+from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.api.utils.database import Base
@@ -16,106 +17,18 @@ ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
-class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+@lru_cache(maxsize=None)
+def _dumper(schema: Type[BaseModel]) -> Callable[..., Dict[str, Any]]:
     """
-    Base repository for synchronous database operations.
-    Implements common CRUD operations.
+    Get the serializer function of a schema class.
+    
+    Args:
+        schema: The Pydantic schema class.
+    
+    Returns:
+        The pydantic-core serializer, called as dumper(obj, exclude_unset=...).
     """
-    def __init__(self, model: Type[ModelType]):
-        """
-        Initialize the repository with a model.
-        
-        Args:
-            model: The SQLAlchemy model class.
-        """
-        self.model = model
-
-    def get(self, db: Session, id: Any) -> Optional[ModelType]:
-        """
-        Get a record by ID.
-        
-        Args:
-            db: The database session.
-            id: The record ID.
-        
-        Returns:
-            The record if found, None otherwise.
-        """
-        return db.query(self.model).filter(self.model.id == id).first()
-
-    def get_all(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        """
-        Get all records with pagination.
-        
-        Args:
-            db: The database session.
-            skip: Number of records to skip.
-            limit: Maximum number of records to return.
-        
-        Returns:
-            List of records.
-        """
-        return db.query(self.model).offset(skip).limit(limit).all()
-
-    def create(self, db: Session, *, obj_in: CreateSchemaType, **kwargs) -> ModelType:
-        """
-        Create a new record.
-        
-        Args:
-            db: The database session.
-            obj_in: The input data.
-            **kwargs: Additional fields.
-        
-        Returns:
-            The created record.
-        """
-        if isinstance(obj_in, dict):
-            obj_in_data = obj_in
-        else:
-            obj_in_data = obj_in.model_dump() if hasattr(obj_in, "model_dump") else obj_in.dict()
-        db_obj = self.model(**obj_in_data, **kwargs)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
-
-    def update(self, db: Session, *, db_obj: ModelType, obj_in: UpdateSchemaType) -> ModelType:
-        """
-        Update a record.
-        
-        Args:
-            db: The database session.
-            db_obj: The database object to update.
-            obj_in: The new data.
-        
-        Returns:
-            The updated record.
-        """
-        obj_data = dict(db_obj.__dict__)
-        update_data = obj_in.model_dump(exclude_unset=True) if hasattr(obj_in, "model_dump") else obj_in.dict(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
-
-    def delete(self, db: Session, *, id: Any) -> ModelType:
-        """
-        Delete a record.
-        
-        Args:
-            db: The database session.
-            id: The record ID.
-        
-        Returns:
-            The deleted record.
-        """
-        obj = db.query(self.model).filter(self.model.id == id).first()
-        db.delete(obj)
-        db.commit()
-        return obj
+    return schema.__pydantic_serializer__.to_python
 
 class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
@@ -130,6 +43,8 @@ class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]
             model: The SQLAlchemy model class.
         """
         self.model = model
+        # Column names that may be set through update()
+        self._columns = frozenset(column.key for column in model.__table__.columns)
 
     async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
         """
@@ -142,8 +57,7 @@ class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]
         Returns:
             The record if found, None otherwise.
         """
-        result = await db.execute(select(self.model).filter(self.model.id == id))
-        return result.scalars().first()
+        return await db.get(self.model, id)
 
     async def get_all(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> List[ModelType]:
         """
@@ -164,6 +78,10 @@ class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]
         """
         Create a new record.
         
+        Where the database supports INSERT ... RETURNING the generated columns
+        come back with the insert; otherwise the record is flushed and then
+        refreshed to load them.
+        
         Args:
             db: The async database session.
             obj_in: The input data.
@@ -175,10 +93,18 @@ class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]
         if isinstance(obj_in, dict):
             obj_in_data = obj_in
         else:
-            obj_in_data = obj_in.model_dump() if hasattr(obj_in, "model_dump") else obj_in.dict()
+            obj_in_data = _dumper(type(obj_in))(obj_in)
+        
+        # One round-trip when the dialect can return the inserted row (not MySQL)
+        if db.get_bind().dialect.insert_returning:
+            result = await db.execute(
+                insert(self.model).values(**obj_in_data, **kwargs).returning(self.model)
+            )
+            return result.scalar_one()
+        
         db_obj = self.model(**obj_in_data, **kwargs)
         db.add(db_obj)
-        await db.commit()
+        await db.flush()
         await db.refresh(db_obj)
         return db_obj
 
@@ -194,13 +120,12 @@ class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]
         Returns:
             The updated record.
         """
-        obj_data = dict(db_obj.__dict__)
-        update_data = obj_in.model_dump(exclude_unset=True) if hasattr(obj_in, "model_dump") else obj_in.dict(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        update_data = _dumper(type(obj_in))(obj_in, exclude_unset=True)
+        for field, value in update_data.items():
+            if field in self._columns:
+                setattr(db_obj, field, value)
         db.add(db_obj)
-        await db.commit()
+        await db.flush()
         await db.refresh(db_obj)
         return db_obj
 
@@ -215,8 +140,7 @@ class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]
         Returns:
             The deleted record.
         """
-        result = await db.execute(select(self.model).filter(self.model.id == id))
-        obj = result.scalars().first()
+        obj = await db.get(self.model, id)
         await db.delete(obj)
-        await db.commit()
+        await db.flush()
         return obj 
\ No newline at end of file
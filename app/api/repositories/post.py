@@ -2,67 +2,65 @@
 Post repository module.
 This module provides repository classes for post operations.
 """
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import delete, func, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import Session
 
 from app.api.models.post import Post
 from app.api.schemas.post import PostCreate, PostUpdate
-from app.api.repositories.base import BaseRepository, AsyncBaseRepository
+from app.api.repositories.base import AsyncBaseRepository
 
-class PostRepository(BaseRepository[Post, PostCreate, PostUpdate]):
+class AsyncPostRepository(AsyncBaseRepository[Post, PostCreate, PostUpdate]):
     """
-    Repository for synchronous post operations.
+    Repository for asynchronous post operations.
     """
-    def get_by_user_id(self, db: Session, user_id: int) -> List[Post]:
+    async def get_by_user_id(self, db: AsyncSession, user_id: int) -> List[Dict[str, Any]]:
         """
-        Get all posts for a user.
+        Get all posts for a user asynchronously.
+        
+        Only the columns exposed by the post schemas are selected, and rows are
+        returned as plain dicts rather than ORM instances.
         
         Args:
-            db: The database session.
+            db: The async database session.
             user_id: The user ID.
         
         Returns:
-            List of posts.
+            List of posts as column-name to value mappings.
         """
-        return db.query(Post).filter(Post.user_id == user_id).all()
+        # lambda_stmt reuses the built statement and its cache key across calls
+        result = await db.execute(lambda_stmt(
+            lambda: select(Post.id, Post.text, Post.user_id, Post.created_at, Post.updated_at)
+            .filter(Post.user_id == user_id)
+        ))
+        return [dict(row) for row in result.mappings()]
         
-    def get_by_id_and_user_id(self, db: Session, post_id: int, user_id: int) -> Optional[Post]:
+    async def get_version_by_user_id(
+        self, db: AsyncSession, user_id: int
+    ) -> Tuple[int, Optional[int], Optional[datetime]]:
         """
-        Get a post by ID and user ID.
+        Get a summary of a user's posts that changes whenever they change.
         
         Args:
-            db: The database session.
-            post_id: The post ID.
+            db: The async database session.
             user_id: The user ID.
         
         Returns:
-            The post if found, None otherwise.
+            The post count, the highest post ID and the latest update time.
         """
-        return db.query(Post).filter(Post.id == post_id, Post.user_id == user_id).first()
+        result = await db.execute(lambda_stmt(
+            lambda: select(func.count(Post.id), func.max(Post.id), func.max(Post.updated_at))
+            .filter(Post.user_id == user_id)
+        ))
+        return tuple(result.one())
 
-class AsyncPostRepository(AsyncBaseRepository[Post, PostCreate, PostUpdate]):
-    """
-    Repository for asynchronous post operations.
-    """
-    async def get_by_user_id(self, db: AsyncSession, user_id: int) -> List[Post]:
-        """
-        Get all posts for a user asynchronously.
-        
-        Args:
-            db: The async database session.
-            user_id: The user ID.
-        
-        Returns:
-            List of posts.
+    async def delete_by_id_and_user_id(self, db: AsyncSession, post_id: int, user_id: int) -> int:
         """
-        result = await db.execute(select(Post).filter(Post.user_id == user_id))
-        return result.scalars().all()
+        Delete a post by ID and user ID asynchronously.
         
-    async def get_by_id_and_user_id(self, db: AsyncSession, post_id: int, user_id: int) -> Optional[Post]:
-        """
-        Get a post by ID and user ID asynchronously.
+        Ownership is checked by the DELETE itself, so no row is loaded first.
         
         Args:
             db: The async database session.
@@ -70,11 +68,12 @@ class AsyncPostRepository(AsyncBaseRepository[Post, PostCreate, PostUpdate]):
             user_id: The user ID.
         
         Returns:
-            The post if found, None otherwise.
+            The number of deleted rows.
         """
-        result = await db.execute(select(Post).filter(Post.id == post_id, Post.user_id == user_id))
-        return result.scalars().first()
+        result = await db.execute(
+            delete(Post).where(Post.id == post_id, Post.user_id == user_id)
+        )
+        return result.rowcount
 
 # Create repository instances
-post_repository = PostRepository(Post)
 async_post_repository = AsyncPostRepository(Post) 
\ No newline at end of file
@@ -2,36 +2,172 @@
 User repository module.
 This module provides repository classes for user operations.
 """
-from typing import Optional
+from typing import Any, Dict, Optional
+from cachetools import TTLCache
+from sqlalchemy import Row, inspect, lambda_stmt
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.api.models.user import User
 from app.api.schemas.user import UserCreate, UserUpdate
-from app.api.repositories.base import BaseRepository, AsyncBaseRepository
+from app.api.repositories.base import AsyncBaseRepository
+from app.api.utils.database import after_commit
 
-class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
+# Loaded user rows, detached from any session
+# Structure: {user_id: {column_name: value}}, holding every column or only those loaded by get_light
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=30)
+
+# Name of the unique index on users.email, as reported in duplicate key errors
+_EMAIL_INDEX = "ix_users_email"
+
+def _is_duplicate_email(error: IntegrityError) -> bool:
+    """
+    Check whether an integrity error was raised by the unique email index.
+    
+    Args:
+        error: The integrity error.
+    
+    Returns:
+        True if the email is already registered.
     """
-    Repository for synchronous user operations.
+    # MySQL names the violated key after the duplicate value:
+    # "Duplicate entry '...' for key 'users.ix_users_email'"
+    return _EMAIL_INDEX in str(error.orig).rpartition(" for key ")[2]
+
+class AsyncUserRepository(AsyncBaseRepository[User, UserCreate, UserUpdate]):
     """
-    def get_by_email(self, db: Session, email: str) -> Optional[User]:
+    Repository for asynchronous user operations.
+    Primary-key lookups are served from a short-lived in-process cache.
+    """
+    async def get(self, db: AsyncSession, id: Any) -> Optional[User]:
         """
-        Get a user by email.
+        Get a user by ID asynchronously, using the user cache when possible.
+        
+        The session may already hold the user as loaded by get_light, with
+        only id and email set; the other columns are then loaded explicitly
+        before the user is cached, since lazy loading is unavailable in async
+        code.
         
         Args:
-            db: The database session.
-            email: The email to search for.
+            db: The async database session.
+            id: The user ID.
         
         Returns:
             The user if found, None otherwise.
         """
-        return db.query(User).filter(User.email == email).first()
+        data = _user_cache.get(id)
+        if data is not None and self._columns <= data.keys():
+            return await self._merge_cached(db, data)
+        
+        user = await super().get(db, id)
+        if user is not None:
+            unloaded = self._columns & inspect(user).unloaded
+            if unloaded:
+                await db.refresh(user, attribute_names=list(unloaded))
+            _user_cache[id] = {column: getattr(user, column) for column in self._columns}
+        return user
+
+    async def get_light(self, db: AsyncSession, id: Any) -> Optional[User]:
+        """
+        Get a user by ID asynchronously, loading only the id and email columns.
+        
+        On a cache miss the columns are read with get_core. Either way a User
+        is then built from them and merged into the session without a load,
+        so it is placed in the identity map like any other loaded instance.
+        
+        hashed_password, created_at and updated_at are left unloaded, so this
+        suits callers that only need to identify the user, such as the
+        authentication dependency. Accessing those attributes on the returned
+        user triggers a lazy load, which raises MissingGreenlet in async code.
+        
+        Args:
+            db: The async database session.
+            id: The user ID.
+        
+        Returns:
+            The user if found, None otherwise.
+        """
+        data = _user_cache.get(id)
+        if data is None:
+            row = await self.get_core(db, id)
+            if row is None:
+                return None
+            data = _user_cache[id] = dict(row._mapping)
+        
+        return await self._merge_cached(db, data)
+
+    async def get_core(self, db: AsyncSession, id: Any) -> Optional[Row]:
+        """
+        Get the id and email of a user as a Core row.
+        
+        The select runs through Core rather than the ORM loader and only
+        fetches the two columns; building a User from the row is left to the
+        caller.
+        
+        Args:
+            db: The async database session.
+            id: The user ID.
+        
+        Returns:
+            The row if found, None otherwise.
+        """
+        # lambda_stmt reuses the built statement and its cache key across calls
+        result = await db.execute(lambda_stmt(
+            lambda: select(User.__table__.c.id, User.__table__.c.email).where(User.__table__.c.id == id)
+        ))
+        return result.first()
+
+    async def _merge_cached(self, db: AsyncSession, data: Dict[str, Any]) -> User:
+        """
+        Attach a cached user to a session without querying the database.
+        
+        Args:
+            db: The async database session.
+            data: The cached column values.
+        
+        Returns:
+            The user, persistent in the given session.
+        """
+        user = User(**data)
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+
+    async def update(self, db: AsyncSession, *, db_obj: User, obj_in: UserUpdate) -> User:
+        """
+        Update a user asynchronously and drop it from the user cache.
+        
+        Args:
+            db: The async database session.
+            db_obj: The user to update.
+            obj_in: The new data.
+        
+        Returns:
+            The updated user.
+        """
+        user_id = db_obj.id
+        _user_cache.pop(user_id, None)
+        # Evict again after commit in case a concurrent request re-cached the old row
+        after_commit(db, lambda: _user_cache.pop(user_id, None))
+        return await super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    async def delete(self, db: AsyncSession, *, id: Any) -> User:
+        """
+        Delete a user asynchronously and drop it from the user cache.
+        
+        Args:
+            db: The async database session.
+            id: The user ID.
+        
+        Returns:
+            The deleted user.
+        """
+        _user_cache.pop(id, None)
+        # Evict again after commit in case a concurrent request re-cached the old row
+        after_commit(db, lambda: _user_cache.pop(id, None))
+        return await super().delete(db, id=id)
 
-class AsyncUserRepository(AsyncBaseRepository[User, UserCreate, UserUpdate]):
-    """
-    Repository for asynchronous user operations.
-    """
     async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
         """
         Get a user by email asynchronously.
@@ -43,9 +179,36 @@ class AsyncUserRepository(AsyncBaseRepository[User, UserCreate, UserUpdate]):
         Returns:
             The user if found, None otherwise.
         """
-        result = await db.execute(select(User).filter(User.email == email))
+        result = await db.execute(lambda_stmt(lambda: select(User).filter(User.email == email)))
         return result.scalars().first()
 
+    async def create_if_not_exists(self, db: AsyncSession, *, obj_in: Dict[str, Any], **kwargs) -> Optional[User]:
+        """
+        Create a new user unless the email is already registered.
+        
+        Relies on the unique index on email instead of a separate lookup, so
+        the check is the insert itself and no SELECT runs before it. On a
+        duplicate email the session's transaction is rolled back, so this must
+        not be called after other work in the same transaction.
+        
+        Args:
+            db: The async database session.
+            obj_in: The input data.
+            **kwargs: Additional fields.
+        
+        Returns:
+            The created user, or None if the email is already registered.
+        
+        Raises:
+            IntegrityError: If any other constraint is violated.
+        """
+        try:
+            return await self.create(db, obj_in=obj_in, **kwargs)
+        except IntegrityError as e:
+            if not _is_duplicate_email(e):
+                raise
+            await db.rollback()
+            return None
+
 # Create repository instances
-user_repository = UserRepository(User)
 async_user_repository = AsyncUserRepository(User) 
\ No newline at end of file
@@ -3,23 +3,34 @@ Authentication routes module.
 This module defines routes for user authentication.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
-from app.api.utils.database import get_db, get_async_db
-from app.api.schemas.user import UserCreate, UserResponse
+from app.api.utils.database import get_async_db
+from app.api.schemas.user import UserCreate, UserResponse, is_login_email
 from app.api.schemas.token import Token
-from app.api.services.user import user_service
-from app.api.services.base import AsyncServiceStrategy
-from app.api.repositories.user import async_user_repository
+from app.api.dependencies.services import get_user_service
+from app.api.services.user import UserService
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(prefix="/auth", tags=["Authentication"], default_response_class=ORJSONResponse)
+
+# Error responses
+EMAIL_REGISTERED_ERROR = {
+    "status_code": status.HTTP_400_BAD_REQUEST,
+    "detail": "Email already registered",
+}
+LOGIN_FAILED_ERROR = {
+    "status_code": status.HTTP_401_UNAUTHORIZED,
+    "detail": "Incorrect email or password",
+    "headers": {"WWW-Authenticate": "Bearer"},
+}
 
 @router.post("/signup", response_model=Token, status_code=status.HTTP_201_CREATED)
 async def signup(
     user_data: UserCreate, 
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_db),
+    user_service: UserService = Depends(get_user_service)
 ):
     """
     Sign up a new user.
@@ -27,6 +38,7 @@ async def signup(
     Args:
         user_data (UserCreate): The user data.
         db (AsyncSession): The database session.
+        user_service (UserService): The user service.
         
     Returns:
         Token: The access token.
@@ -34,19 +46,10 @@ async def signup(
     Raises:
         HTTPException: If the email is already registered.
     """
-    # Set async strategy for this request
-    user_service.set_strategy(AsyncServiceStrategy(async_user_repository))
-    
-    # Check if the email is already registered
-    db_user = await user_service.get_user_by_email_async(db, email=user_data.email)
-    if db_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
-    # Create the user
-    user = await user_service.create_user_async(db=db, user_data=user_data)
+    # Create the user unless the email is already registered
+    user = await user_service.create_user_if_not_exists_async(db=db, user_data=user_data)
+    if user is None:
+        raise HTTPException(**EMAIL_REGISTERED_ERROR)
     
     # Generate a token
     token = user_service.create_user_token(user)
@@ -56,7 +59,8 @@ async def signup(
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(), 
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_db),
+    user_service: UserService = Depends(get_user_service)
 ):
     """
     Log in a user.
@@ -64,6 +68,7 @@ async def login(
     Args:
         form_data (OAuth2PasswordRequestForm): The login form data.
         db (AsyncSession): The database session.
+        user_service (UserService): The user service.
         
     Returns:
         Token: The access token.
@@ -71,17 +76,14 @@ async def login(
     Raises:
         HTTPException: If authentication fails.
     """
-    # Set async strategy for this request
-    user_service.set_strategy(AsyncServiceStrategy(async_user_repository))
+    # Malformed emails cannot belong to a user, reject them without a lookup
+    if not is_login_email(form_data.username):
+        raise HTTPException(**LOGIN_FAILED_ERROR)
     
     # Authenticate the user
     user = await user_service.authenticate_user_async(db, form_data.username, form_data.password)
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise HTTPException(**LOGIN_FAILED_ERROR)
     
     # Generate a token
     token = user_service.create_user_token(user)
@@ -2,26 +2,52 @@
 Posts routes module.
 This module defines routes for post operations.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
 from app.api.utils.database import get_async_db
-from app.api.dependencies.auth import get_current_user, get_current_user_async
+from app.api.dependencies.auth import get_current_user_async
 from app.api.models.user import User
 from app.api.schemas.post import PostCreate, PostResponse, PostListResponse, PostDelete
-from app.api.services.post import post_service
-from app.api.services.base import AsyncServiceStrategy
-from app.api.repositories.post import async_post_repository
-from app.api.repositories.user import async_user_repository
+from app.api.dependencies.services import get_post_service
+from app.api.services.post import PostService
 
-router = APIRouter(prefix="/posts", tags=["Posts"])
+router = APIRouter(prefix="/posts", tags=["Posts"], default_response_class=ORJSONResponse)
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check whether an If-None-Match header matches an ETag.
+    
+    Args:
+        if_none_match (Optional[str]): The If-None-Match header value.
+        etag (str): The current ETag.
+        
+    Returns:
+        bool: True if the client already has the current representation.
+    """
+    if if_none_match is None:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in if_none_match.split(","))
+
+# Error responses
+USER_NOT_FOUND_ERROR = {
+    "status_code": status.HTTP_404_NOT_FOUND,
+    "detail": "User not found",
+}
+POST_NOT_FOUND_ERROR = {
+    "status_code": status.HTTP_404_NOT_FOUND,
+    "detail": "Post not found",
+}
 
 @router.post("/", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def add_post(
     post_data: PostCreate,
     db: AsyncSession = Depends(get_async_db),
-    current_user: User = Depends(get_current_user_async)
+    current_user: User = Depends(get_current_user_async),
+    post_service: PostService = Depends(get_post_service)
 ):
     """
     Create a new post.
@@ -30,55 +56,67 @@ async def add_post(
         post_data (PostCreate): The post data.
         db (AsyncSession): The database session.
         current_user (User): The authenticated user.
+        post_service (PostService): The post service.
         
     Returns:
         PostResponse: The created post.
+        
+    Raises:
+        HTTPException: If the user was deleted after authenticating.
     """
-    # Set async strategy for this request
-    post_service.set_strategy(AsyncServiceStrategy(async_post_repository))
-    
-    # Extract user ID here to avoid lazy loading issues
-    user_id = current_user.id
-    
-    # Get a fully loaded user instance to avoid async lazy loading issues
-    user = await async_user_repository.get(db, user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    return await post_service.create_post_async(db=db, post_data=post_data, user=user)
+    try:
+        return await post_service.create_post_async(db=db, post_data=post_data, user_id=current_user.id)
+    except IntegrityError:
+        # The foreign key rejected the post because the user no longer exists
+        raise HTTPException(**USER_NOT_FOUND_ERROR) from None
 
-@router.get("/", response_model=PostListResponse)
+@router.get(
+    "/",
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": PostListResponse}, status.HTTP_304_NOT_MODIFIED: {}}
+)
 async def get_posts(
     db: AsyncSession = Depends(get_async_db),
-    current_user: User = Depends(get_current_user_async)
+    current_user: User = Depends(get_current_user_async),
+    post_service: PostService = Depends(get_post_service),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Get all posts for the current user with caching.
     
+    The cached JSON body is returned as is; PostListResponse only documents
+    the response shape. Responses carry an ETag, and a request whose
+    If-None-Match still matches it gets an empty 304 instead.
+    
     Args:
         db (AsyncSession): The database session.
         current_user (User): The authenticated user.
+        post_service (PostService): The post service.
+        if_none_match (Optional[str]): The If-None-Match header.
         
     Returns:
-        PostListResponse: The list of posts.
+        Response: The list of posts, or 304 Not Modified.
     """
-    # Set async strategy for this request
-    post_service.set_strategy(AsyncServiceStrategy(async_post_repository))
-    
     # Extract user ID to avoid lazy loading issues
     user_id = current_user.id
     
-    posts = await post_service.get_posts_by_user_async(db=db, user_id=user_id)
-    return {"posts": posts}
+    # The ETag and the body are read in the same transaction, and a cached body
+    # is only reused for the ETag it was built for
+    etag = await post_service.get_posts_etag_async(db=db, user_id=user_id)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    payload = await post_service.get_posts_json_by_user_async(db=db, user_id=user_id, etag=etag)
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_post(
     post_id: int,
     db: AsyncSession = Depends(get_async_db),
-    current_user: User = Depends(get_current_user_async)
+    current_user: User = Depends(get_current_user_async),
+    post_service: PostService = Depends(get_post_service)
 ):
     """
     Delete a post.
@@ -87,28 +125,15 @@ async def remove_post(
         post_id (int): The post ID to delete.
         db (AsyncSession): The database session.
         current_user (User): The authenticated user.
+        post_service (PostService): The post service.
         
     Raises:
         HTTPException: If the post is not found.
     """
-    # Set async strategy for this request
-    post_service.set_strategy(AsyncServiceStrategy(async_post_repository))
-    
     # Extract user ID to avoid lazy loading issues
     user_id = current_user.id
     
-    # Check if the post exists and belongs to the current user
-    post = await post_service.get_post_by_id_async(db, post_id=post_id, user_id=user_id)
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Post not found"
-        )
-    
-    # Delete the post
-    success = await post_service.delete_post_async(db=db, post_id=post_id, user_id=user_id)
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete post"
-        ) 
\ No newline at end of file
+    # Delete the post; nothing is deleted if it does not exist or is not the user's
+    deleted = await post_service.delete_post_async(db=db, post_id=post_id, user_id=user_id)
+    if not deleted:
+        raise HTTPException(**POST_NOT_FOUND_ERROR) 
\ No newline at end of file
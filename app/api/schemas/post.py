@@ -6,6 +6,32 @@ from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 
+# 1MB = 1048576 bytes
+MAX_CONTENT_BYTES = 1048576
+
+def _check_content_size(v: str) -> str:
+    """
+    Check that the UTF-8 size of the post content is within the limit.
+    
+    A UTF-8 character takes at most 4 bytes and ASCII text takes exactly one
+    byte per character, so the text is only encoded when neither bound settles it.
+    
+    Args:
+        v (str): The post content to check.
+        
+    Returns:
+        str: The checked post content.
+        
+    Raises:
+        ValueError: If the content size exceeds the limit.
+    """
+    if len(v) * 4 <= MAX_CONTENT_BYTES or v.isascii():
+        return v
+    
+    if len(v.encode('utf-8')) > MAX_CONTENT_BYTES:
+        raise ValueError("Post content size exceeds the limit of 1MB")
+    return v
+
 class PostBase(BaseModel):
     """
     Base schema for post data.
@@ -34,13 +60,7 @@ class PostBase(BaseModel):
         Raises:
             ValueError: If the content size exceeds the limit.
         """
-        # Calculate size in bytes (UTF-8 encoding)
-        size_in_bytes = len(v.encode('utf-8'))
-        
-        # 1MB = 1048576 bytes
-        if size_in_bytes > 1048576:
-            raise ValueError("Post content size exceeds the limit of 1MB")
-        return v
+        return _check_content_size(v)
 
 class PostCreate(PostBase):
     """
@@ -82,13 +102,7 @@ class PostUpdate(BaseModel):
         if v is None:
             return v
             
-        # Calculate size in bytes (UTF-8 encoding)
-        size_in_bytes = len(v.encode('utf-8'))
-        
-        # 1MB = 1048576 bytes
-        if size_in_bytes > 1048576:
-            raise ValueError("Post content size exceeds the limit of 1MB")
-        return v
+        return _check_content_size(v)
 
 class Post(PostBase):
     """
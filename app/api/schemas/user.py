@@ -3,9 +3,86 @@ User schema module.
 This module defines Pydantic schemas for user-related operations.
 """
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
+from typing import Annotated, Optional
+from pydantic import AfterValidator, BaseModel, EmailStr, Field, ConfigDict
 import re
+import string
+
+# Character classes accepted in passwords
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
+_SPECIAL = frozenset("@$!%*?&")
+_PASSWORD_CHARS = _LOWERCASE | _UPPERCASE | _DIGITS | _SPECIAL
+
+def _is_strong_password(v: str) -> bool:
+    """
+    Check that a password has at least 8 characters, only uses allowed
+    characters, and contains at least one lowercase letter, one uppercase
+    letter, one digit, and one special character.
+    
+    The password is scanned once to collect its distinct characters; every
+    other check runs on that set.
+    
+    Args:
+        v (str): The password to check.
+    
+    Returns:
+        bool: True if the password is strong enough.
+    """
+    chars = set(v)
+    return (
+        len(v) >= 8
+        and chars <= _PASSWORD_CHARS
+        and not chars.isdisjoint(_LOWERCASE)
+        and not chars.isdisjoint(_UPPERCASE)
+        and not chars.isdisjoint(_DIGITS)
+        and not chars.isdisjoint(_SPECIAL)
+    )
+
+def _check_password(v: str) -> str:
+    """
+    Validate password strength.
+    
+    Args:
+        v (str): The password to validate.
+    
+    Returns:
+        str: The validated password.
+    
+    Raises:
+        ValueError: If the password is too weak.
+    """
+    # Check for at least one lowercase letter, one uppercase letter, one digit, and one special character
+    if not _is_strong_password(v):
+        raise ValueError(
+            "Password must contain at least one lowercase letter, one uppercase letter, "
+            "one digit, and one special character"
+        )
+    return v
+
+# Password type shared by the create and update schemas
+Password = Annotated[
+    str,
+    Field(description="User password", min_length=8, max_length=100),
+    AfterValidator(_check_password)
+]
+
+# Loose email shape check for login, where the user lookup rejects anything
+# that is not registered
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+def is_login_email(v: str) -> bool:
+    """
+    Check the shape of a login email without full email-validator parsing.
+    
+    Args:
+        v (str): The email to check.
+    
+    Returns:
+        bool: True if the email looks like an address.
+    """
+    return _EMAIL_RE.match(v) is not None
 
 class UserBase(BaseModel):
     """
@@ -22,36 +99,9 @@ class UserCreate(UserBase):
     
     Attributes:
         email (EmailStr): The user's email address.
-        password (str): The user's password.
+        password (Password): The user's password.
     """
-    password: str = Field(
-        ..., 
-        description="User password", 
-        min_length=8, 
-        max_length=100
-    )
-    
-    @field_validator("password")
-    def password_strength(cls, v):
-        """
-        Validate password strength.
-        
-        Args:
-            v (str): The password to validate.
-        
-        Returns:
-            str: The validated password.
-        
-        Raises:
-            ValueError: If the password is too weak.
-        """
-        # Check for at least one lowercase letter, one uppercase letter, one digit, and one special character
-        if not re.match(r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]{8,}$", v):
-            raise ValueError(
-                "Password must contain at least one lowercase letter, one uppercase letter, "
-                "one digit, and one special character"
-            )
-        return v
+    password: Password
 
 class UserUpdate(BaseModel):
     """
@@ -59,40 +109,10 @@ class UserUpdate(BaseModel):
     
     Attributes:
         email (Optional[EmailStr]): The user's email address.
-        password (Optional[str]): The user's password.
+        password (Optional[Password]): The user's password.
     """
     email: Optional[EmailStr] = Field(None, description="User email address")
-    password: Optional[str] = Field(
-        None, 
-        description="User password", 
-        min_length=8, 
-        max_length=100
-    )
-    
-    @field_validator("password")
-    def password_strength(cls, v):
-        """
-        Validate password strength.
-        
-        Args:
-            v (str): The password to validate.
-        
-        Returns:
-            str: The validated password.
-        
-        Raises:
-            ValueError: If the password is too weak.
-        """
-        if v is None:
-            return v
-            
-        # Check for at least one lowercase letter, one uppercase letter, one digit, and one special character
-        if not re.match(r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]{8,}$", v):
-            raise ValueError(
-                "Password must contain at least one lowercase letter, one uppercase letter, "
-                "one digit, and one special character"
-            )
-        return v
+    password: Optional[Password] = None
 
 class UserInDB(UserBase):
     """
@@ -2,128 +2,127 @@
 Post service module.
 This module provides service functions for post operations.
 """
-from typing import List, Optional
+from typing import Any, Dict, List
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
 from app.api.models.post import Post
-from app.api.models.user import User
 from app.api.schemas.post import PostCreate, PostDelete, PostUpdate
 from app.api.utils.cache import set_cache, get_cache, clear_cache, generate_post_cache_key
-from app.api.repositories.post import post_repository, async_post_repository
-from app.api.services.base import BaseService, SyncServiceStrategy, AsyncServiceStrategy
+from app.api.repositories.post import AsyncPostRepository, async_post_repository
+from app.api.utils.database import after_commit
 
-class PostService(BaseService[Post]):
+class PostService:
     """
-    Post service class with support for both sync and async operations.
+    Post service class for async operations.
     """
-    async def get_posts_by_user_async(self, db: AsyncSession, user_id: int) -> List[Post]:
+    def __init__(self, repository: AsyncPostRepository):
         """
-        Get all posts for a user with caching asynchronously.
+        Initialize with a repository.
+        
+        Args:
+            repository (AsyncPostRepository): The repository to operate on.
+        """
+        self.repository = repository
+        
+    async def get_posts_by_user_async(self, db: AsyncSession, user_id: int) -> List[Dict[str, Any]]:
+        """
+        Get all posts for a user asynchronously.
         
         Args:
             db (AsyncSession): The async database session.
             user_id (int): The user ID.
             
         Returns:
-            List[Post]: The list of posts.
+            List[Dict[str, Any]]: The list of posts as plain mappings.
         """
-        # Generate cache key for this user's posts
-        cache_key = generate_post_cache_key(user_id)
-        
-        # Try to get from cache
-        cached_posts = get_cache(cache_key)
-        if cached_posts is not None:
-            return cached_posts
-        
-        # If not in cache, fetch from the database
-        posts = await async_post_repository.get_by_user_id(db, user_id)
-        
-        # Cache the posts for 5 minutes
-        set_cache(cache_key, posts, ttl_minutes=5)
-        
-        return posts
+        return await self.repository.get_by_user_id(db, user_id)
     
-    def get_posts_by_user(self, db: Session, user_id: int) -> List[Post]:
+    async def get_posts_json_by_user_async(self, db: AsyncSession, user_id: int, etag: str) -> bytes:
         """
-        Get all posts for a user with caching.
+        Get all posts for a user as a serialized post list with caching asynchronously.
+        
+        The JSON body is cached rather than the rows, so a cache hit needs no
+        serialization at all. It is cached together with the ETag it was built
+        for and only reused while that ETag is current, so a body cached by
+        this process is never served for changes made through another one.
         
         Args:
-            db (Session): The database session.
+            db (AsyncSession): The async database session.
             user_id (int): The user ID.
+            etag (str): The current ETag of the user's posts.
             
         Returns:
-            List[Post]: The list of posts.
+            bytes: The post list as JSON, shaped like PostListResponse.
         """
         # Generate cache key for this user's posts
         cache_key = generate_post_cache_key(user_id)
         
         # Try to get from cache
-        cached_posts = get_cache(cache_key)
-        if cached_posts is not None:
-            return cached_posts
+        cached = get_cache(cache_key)
+        if cached is not None and cached[0] == etag:
+            return cached[1]
         
-        # If not in cache, fetch from the database
-        posts = post_repository.get_by_user_id(db, user_id)
+        # If not in cache or outdated, fetch from the database and serialize once
+        posts = await self.get_posts_by_user_async(db, user_id)
+        payload = orjson.dumps({"posts": posts})
         
-        # Cache the posts for 5 minutes
-        set_cache(cache_key, posts, ttl_minutes=5)
+        # Cache the serialized posts with their ETag for 5 minutes
+        set_cache(cache_key, (etag, payload), ttl_minutes=5)
         
-        return posts
-
-    async def create_post_async(self, db: AsyncSession, post_data: PostCreate, user: User) -> Post:
+        return payload
+    
+    async def get_posts_etag_async(self, db: AsyncSession, user_id: int) -> str:
         """
-        Create a new post asynchronously.
+        Get an ETag for a user's list of posts.
+        
+        Creating a post raises the highest ID, deleting one lowers the count,
+        and editing one moves the latest update time.
         
         Args:
             db (AsyncSession): The async database session.
-            post_data (PostCreate): The post data.
-            user (User): The user creating the post.
+            user_id (int): The user ID.
             
         Returns:
-            Post: The created post.
+            str: A weak ETag for the current list of posts.
         """
-        # Extract user_id to avoid lazy loading issues
-        user_id = user.id
-        
-        # Create a new post using repository
-        post = await async_post_repository.create(
-            db=db, 
-            obj_in=post_data, 
-            user_id=user_id
-        )
-        
-        # Invalidate the cached posts for this user
-        cache_key = generate_post_cache_key(user_id)
-        clear_cache(cache_key)
-        
-        return post
+        count, max_id, updated_at = await self.repository.get_version_by_user_id(db, user_id)
+        timestamp = int(updated_at.timestamp()) if updated_at is not None else 0
+        return f'W/"{user_id}-{count}-{max_id or 0}-{timestamp}"'
     
-    def create_post(self, db: Session, post_data: PostCreate, user: User) -> Post:
+    async def create_post_async(self, db: AsyncSession, post_data: PostCreate, user_id: int) -> Post:
         """
-        Create a new post.
+        Create a new post asynchronously.
+        
+        The user is not looked up; the foreign key on posts.user_id rejects
+        posts for users that do not exist.
         
         Args:
-            db (Session): The database session.
+            db (AsyncSession): The async database session.
             post_data (PostCreate): The post data.
-            user (User): The user creating the post.
+            user_id (int): The ID of the user creating the post.
             
         Returns:
             Post: The created post.
+            
+        Raises:
+            IntegrityError: If the user does not exist.
         """
+        # Generate cache key for this user's posts
+        cache_key = generate_post_cache_key(user_id)
+        
         # Create a new post using repository
-        post = post_repository.create(
+        post = await self.repository.create(
             db=db, 
             obj_in=post_data, 
-            user_id=user.id
+            user_id=user_id
         )
         
-        # Invalidate the cached posts for this user
-        cache_key = generate_post_cache_key(user.id)
-        clear_cache(cache_key)
+        # Invalidate the cached posts for this user once the change is committed
+        after_commit(db, lambda: clear_cache(cache_key))
         
         return post
-
+    
     async def delete_post_async(self, db: AsyncSession, post_id: int, user_id: int) -> bool:
         """
         Delete a post asynchronously.
@@ -136,79 +135,17 @@ class PostService(BaseService[Post]):
         Returns:
             bool: True if the post was deleted, False otherwise.
         """
-        # Get the post
-        post = await self.get_post_by_id_async(db, post_id, user_id)
-        
-        if not post:
-            return False
-        
-        # Delete the post
-        await async_post_repository.delete(db, id=post_id)
-        
-        # Invalidate the cached posts for this user
+        # Delete the post, matching on the owner so nothing needs to be fetched first
         cache_key = generate_post_cache_key(user_id)
-        clear_cache(cache_key)
-        
-        return True
-    
-    def delete_post(self, db: Session, post_id: int, user_id: int) -> bool:
-        """
-        Delete a post.
+        deleted = await self.repository.delete_by_id_and_user_id(db, post_id, user_id)
         
-        Args:
-            db (Session): The database session.
-            post_id (int): The post ID to delete.
-            user_id (int): The user ID of the post owner.
-            
-        Returns:
-            bool: True if the post was deleted, False otherwise.
-        """
-        # Get the post
-        post = self.get_post_by_id(db, post_id, user_id)
-        
-        if not post:
+        if not deleted:
             return False
         
-        # Delete the post
-        post_repository.delete(db, id=post_id)
-        
-        # Invalidate the cached posts for this user
-        cache_key = generate_post_cache_key(user_id)
-        clear_cache(cache_key)
+        # Invalidate the cached posts for this user once the change is committed
+        after_commit(db, lambda: clear_cache(cache_key))
         
         return True
 
-    async def get_post_by_id_async(self, db: AsyncSession, post_id: int, user_id: int) -> Optional[Post]:
-        """
-        Get a post by ID asynchronously.
-        
-        Args:
-            db (AsyncSession): The async database session.
-            post_id (int): The post ID.
-            user_id (int): The user ID of the post owner.
-            
-        Returns:
-            Optional[Post]: The post if found, None otherwise.
-        """
-        return await async_post_repository.get_by_id_and_user_id(db, post_id, user_id)
-    
-    def get_post_by_id(self, db: Session, post_id: int, user_id: int) -> Optional[Post]:
-        """
-        Get a post by ID.
-        
-        Args:
-            db (Session): The database session.
-            post_id (int): The post ID.
-            user_id (int): The user ID of the post owner.
-            
-        Returns:
-            Optional[Post]: The post if found, None otherwise.
-        """
-        return post_repository.get_by_id_and_user_id(db, post_id, user_id)
-
-# Create service instances with strategies
-sync_strategy = SyncServiceStrategy(post_repository)
-async_strategy = AsyncServiceStrategy(async_post_repository)
-
-# Default to sync strategy
-post_service = PostService(sync_strategy) 
\ No newline at end of file
+# Async service, shared by all requests through the service dependencies
+async_post_service = PostService(async_post_repository)
\ No newline at end of file
@@ -2,12 +2,28 @@
 Cache utility module.
 This module provides caching functions for the application.
 """
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+import time
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+from cachetools import TLRUCache
 
-# In-memory cache storage
-# Structure: {cache_key: {"data": any_data, "expires_at": datetime}}
-_cache: Dict[str, Dict[str, Any]] = {}
+def _expires_at(key: str, value: Tuple[Any, float], now: float) -> float:
+    """
+    Compute the expiry time of a cache entry from the TTL stored with it.
+    
+    Args:
+        key (str): The cache key.
+        value (Tuple[Any, float]): The cached data and its TTL in seconds.
+        now (float): The current monotonic time.
+        
+    Returns:
+        float: The monotonic time at which the entry expires.
+    """
+    return now + value[1]
+
+# In-memory cache storage, bounded in size and purging expired entries on access
+# Structure: {cache_key: (data, ttl_seconds)}
+_cache: TLRUCache = TLRUCache(maxsize=10000, ttu=_expires_at, timer=time.monotonic)
 
 def set_cache(key: str, data: Any, ttl_minutes: int = 5) -> None:
     """
@@ -18,11 +34,7 @@ def set_cache(key: str, data: Any, ttl_minutes: int = 5) -> None:
         data (Any): The data to cache.
         ttl_minutes (int): Time to live in minutes.
     """
-    expires_at = datetime.utcnow() + timedelta(minutes=ttl_minutes)
-    _cache[key] = {
-        "data": data,
-        "expires_at": expires_at
-    }
+    _cache[key] = (data, ttl_minutes * 60)
 
 def get_cache(key: str) -> Optional[Any]:
     """
@@ -36,15 +48,10 @@ def get_cache(key: str) -> Optional[Any]:
     """
     cache_item = _cache.get(key)
     
-    if not cache_item:
-        return None
-    
-    if datetime.utcnow() > cache_item["expires_at"]:
-        # Cache expired, remove it and return None
-        del _cache[key]
+    if cache_item is None:
         return None
     
-    return cache_item["data"]
+    return cache_item[0]
 
 def clear_cache(key: str) -> None:
     """
@@ -53,8 +60,7 @@ def clear_cache(key: str) -> None:
     Args:
         key (str): The cache key.
     """
-    if key in _cache:
-        del _cache[key]
+    _cache.pop(key, None)
 
 def clear_all_cache() -> None:
     """
@@ -62,6 +68,7 @@ def clear_all_cache() -> None:
     """
     _cache.clear()
 
+@lru_cache(maxsize=4096)
 def generate_post_cache_key(user_id: int) -> str:
     """
     Generate a cache key for posts.
@@ -72,4 +79,4 @@ def generate_post_cache_key(user_id: int) -> str:
     Returns:
         str: The cache key.
     """
-    return f"user_posts_{user_id}" 
\ No newline at end of file
+    return "user_posts_" + str(user_id) 
\ No newline at end of file
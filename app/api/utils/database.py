@@ -3,11 +3,10 @@ Database connection utility module.
 This module provides database connection functions for the application.
 """
 import os
-from typing import AsyncGenerator, Generator
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from typing import AsyncGenerator, Callable
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Session
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -15,41 +14,66 @@ load_dotenv()
 
 # Get DATABASE_URL from environment variables
 DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    raise RuntimeError(
+        "DATABASE_URL is not set; define it in the environment or in .env "
+        "(see .env.example)"
+    )
 
 # Parse the DATABASE_URL to make it async-compatible
 ASYNC_DATABASE_URL = DATABASE_URL.replace('mysql+mysqlconnector', 'mysql+aiomysql')
 
-# Create engines - keep sync engine for init, use async for operations
-sync_engine = create_engine(DATABASE_URL)
-async_engine = create_async_engine(ASYNC_DATABASE_URL)
+# Create the async engine with a pool sized for concurrent requests
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True
+)
 
-# Create session factories
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
-AsyncSessionLocal = sessionmaker(
-    class_=AsyncSession,
-    autocommit=False,
+# Create session factory; objects stay loaded after commit, so nothing is
+# lazily reloaded once the request's transaction ends
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
     autoflush=False,
-    bind=async_engine
+    expire_on_commit=False
 )
 
 # Create base class for models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """
+    Declarative base class for all models.
+    """
+    pass
 
-def init_db() -> None:
+def after_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
     """
-    Initialize the database by creating all tables defined in models.
-    This function should be called when starting the application.
+    Register a callback to run once the session's transaction is committed.
+    
+    Args:
+        db (AsyncSession): The async database session.
+        callback (Callable[[], None]): The callback to run.
     """
-    # Import all models here to ensure they are registered with Base
-    from app.api.models import user, post  # noqa
+    db.info.setdefault("after_commit", []).append(callback)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit(session: Session) -> None:
+    """
+    Drop the after-commit callbacks of a transaction that was rolled back.
     
-    # Create tables
-    Base.metadata.create_all(bind=sync_engine)
+    Args:
+        session (Session): The session whose transaction was rolled back.
+    """
+    session.info.pop("after_commit", None)
 
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Get an async database session.
     
+    The session's transaction is committed once the request handler returns,
+    so all changes made during a request share a single commit. It is rolled
+    back if the handler raises.
+    
     Returns:
         AsyncGenerator: An async database session generator.
     
@@ -59,21 +83,11 @@ async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     async_session = AsyncSessionLocal()
     try:
         yield async_session
+        await async_session.commit()
+        for callback in async_session.info.pop("after_commit", []):
+            callback()
+    except Exception:
+        await async_session.rollback()
+        raise
     finally:
-        await async_session.close()
-
-def get_db() -> Generator:
-    """
-    Get a synchronous database session (for compatibility).
-    
-    Returns:
-        Generator: A database session generator.
-    
-    Yields:
-        Session: A database session.
-    """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+        await async_session.close()
\ No newline at end of file
@@ -5,7 +5,7 @@ This module provides security functions for password hashing and verification.
 from datetime import datetime, timedelta
 import os
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
 from dotenv import load_dotenv
 
@@ -2,42 +2,11 @@
 Unit of Work pattern module.
 This module provides a Unit of Work implementation for managing database transactions.
 """
-from typing import AsyncContextManager, Callable, ContextManager
-from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncContextManager, Callable
+from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
-from app.api.utils.database import get_db, get_async_db
-
-class UnitOfWork:
-    """
-    Synchronous Unit of Work implementation.
-    Provides a context manager for managing database transactions.
-    """
-    def __init__(self, session_factory: Callable[[], ContextManager[Session]]):
-        """
-        Initialize the Unit of Work.
-        
-        Args:
-            session_factory: A callable that returns a Session context manager.
-        """
-        self.session_factory = session_factory
-
-    @contextmanager
-    def __call__(self):
-        """
-        Get a database session and handle transaction management.
-        
-        Yields:
-            Session: A database session.
-        """
-        with self.session_factory() as session:
-            try:
-                yield session
-                session.commit()
-            except Exception:
-                session.rollback()
-                raise
+from app.api.utils.database import get_async_db
 
 class AsyncUnitOfWork:
     """
@@ -70,5 +39,4 @@ class AsyncUnitOfWork:
                 raise
 
 # Create instances
-sync_uow = UnitOfWork(get_db)
 async_uow = AsyncUnitOfWork(get_async_db) 
\ No newline at end of file
@@ -3,12 +3,13 @@ Main application module.
 This module initializes and configures the FastAPI application.
 """
 import os
+import sys
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 
 from app.api.routes import auth, posts
-from app.api.utils.database import init_db
 
 # Load environment variables
 load_dotenv()
@@ -17,14 +18,17 @@ load_dotenv()
 app = FastAPI(
     title="Post API",
     description="A FastAPI-based API for managing posts",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Configure CORS
+# Configure CORS; FRONTEND_URL takes a comma-separated list of origins, and
+# any origin is allowed when it is unset. Auth uses bearer tokens, not
+# cookies, so credentials are not allowed
+frontend_origins = [origin.strip() for origin in os.getenv("FRONTEND_URL", "*").split(",")]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your frontend URL
-    allow_credentials=True,
+    allow_origins=frontend_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -33,14 +37,6 @@ app.add_middleware(
 app.include_router(auth.router, prefix="/api")
 app.include_router(posts.router, prefix="/api")
 
-@app.on_event("startup")
-async def startup_event():
-    """
-    Execute startup events.
-    """
-    # Initialize the database
-    init_db()
-
 @app.get("/")
 async def root():
     """
@@ -58,5 +54,17 @@ if __name__ == "__main__":
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
     debug = os.getenv("DEBUG", "False").lower() == "true"
+    workers = int(os.getenv("WORKERS", "1"))
+    
+    # uvloop is not available on Windows, fall back to the default loop there
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
     
-    uvicorn.run("app.main:app", host=host, port=port, reload=debug) 
\ No newline at end of file
+    uvicorn.run(
+        "app.main:app",
+        host=host,
+        port=port,
+        reload=debug,
+        loop=loop,
+        http="httptools",
+        workers=workers
+    ) 
\ No newline at end of file
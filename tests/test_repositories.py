@@ -0,0 +1,121 @@
+"""
+Repository tests.
+These run against an in-process SQLite database.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.models.user import User
+from app.api.repositories.user import _user_cache, async_user_repository
+from app.api.utils.database import Base, after_commit
+
+async def _create_engine(tmp_path, insert_returning: bool = True):
+    """
+    Create a database with the application's tables and record its statements.
+    
+    Args:
+        tmp_path: The directory for the database file.
+        insert_returning (bool): Whether the dialect reports RETURNING support.
+    
+    Returns:
+        tuple: The engine and the list that executed SQL statements are appended to.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    engine.sync_engine.dialect.insert_returning = insert_returning
+    statements = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement)
+    )
+    
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    statements.clear()
+    
+    return engine, statements
+
+async def _create_user(tmp_path, insert_returning: bool):
+    """
+    Create a user through the repository and record the statements it ran.
+    
+    Args:
+        tmp_path: The directory for the database file.
+        insert_returning (bool): Whether the dialect reports RETURNING support.
+    
+    Returns:
+        tuple: The created user and the executed SQL statements.
+    """
+    engine, statements = await _create_engine(tmp_path, insert_returning)
+    
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        user = await async_user_repository.create_if_not_exists(
+            db, obj_in={"email": "user@example.com"}, hashed_password="hashed"
+        )
+        await db.commit()
+    
+    await engine.dispose()
+    return user, statements
+
+@pytest.mark.parametrize("insert_returning", [True, False])
+def test_create_loads_generated_columns(insert_returning, tmp_path):
+    user, statements = asyncio.run(_create_user(tmp_path, insert_returning))
+    
+    assert isinstance(user, User)
+    assert user.id is not None
+    assert user.email == "user@example.com"
+    assert user.created_at is not None
+    
+    # The signup is the insert itself, without a lookup or savepoint around it
+    assert not any(statement.startswith("SAVEPOINT") for statement in statements)
+    inserts = [statement for statement in statements if statement.startswith("INSERT")]
+    assert len(inserts) == 1
+    assert ("RETURNING" in inserts[0]) is insert_returning
+    
+    # Without RETURNING the server defaults are read back with a separate SELECT
+    selects = [statement for statement in statements if statement.startswith("SELECT")]
+    assert len(selects) == (0 if insert_returning else 1)
+
+def test_rollback_discards_after_commit_callbacks(tmp_path):
+    async def run():
+        engine, _ = await _create_engine(tmp_path)
+        async with async_sessionmaker(engine)() as db:
+            await async_user_repository.create(
+                db, obj_in={"email": "user@example.com"}, hashed_password="hashed"
+            )
+            after_commit(db, lambda: None)
+            await db.rollback()
+            callbacks = db.info.get("after_commit")
+        await engine.dispose()
+        return callbacks
+    
+    assert asyncio.run(run()) is None
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_get_after_get_light_loads_all_columns(cached, tmp_path):
+    async def run():
+        engine, _ = await _create_engine(tmp_path)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            created = await async_user_repository.create(
+                db, obj_in={"email": "user@example.com"}, hashed_password="hashed"
+            )
+            await db.commit()
+        user_id = created.id
+        _user_cache.clear()
+        
+        if cached:
+            # Fill the cache with every column from an earlier session
+            async with async_sessionmaker(engine)() as db:
+                await async_user_repository.get(db, user_id)
+        
+        async with async_sessionmaker(engine)() as db:
+            light = await async_user_repository.get_light(db, user_id)
+            user = await async_user_repository.get(db, user_id)
+            values = (user is light, user.hashed_password, user.created_at is not None)
+        await engine.dispose()
+        return values
+    
+    assert asyncio.run(run()) == (True, "hashed", True)